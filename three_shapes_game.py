@@ -7,11 +7,121 @@
 """
 
 
-import math        # for sqrt
+import math        # for sqrt, hypot
+import operator    # for index
+
+# numpy is optional; if it is installed, we use it to compute all of the
+# pairwise distances in do_nearby_calls() at once.  If not, we fall back on
+# the plain Python loops.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# numba is optional as well; if it is installed, we compile the distance
+# calculation, which avoids building the big temporary arrays that numpy
+# broadcasting requires.
+try:
+    import numba
+except ImportError:
+    numba = None
 
 from graphics import graphics
 
 
+# when the "nearby_max_dist" config option is set, do_nearby_calls() uses a
+# spatial hash grid to avoid looking at every pair of objects.  For small
+# numbers of objects, building the grid costs more than it saves, so below
+# this count we just check every pair.
+GRID_MIN_OBJS = 32
+
+# the grid is plain Python, though; if the cells are big compared to the
+# window, then most objects end up in the same few cells, and the grid is
+# just a slow way of checking every pair.  So when we have numpy, we only use
+# the grid if the window divides into at least this many cells.
+GRID_MIN_CELLS = 256
+
+# similarly, the numpy version of do_nearby_calls() has a fixed cost for
+# every row, and that's more than the plain Python loop costs when there are
+# only a few objects.  Below this count, we use the Python loop even if we
+# have numpy.
+NUMPY_MIN_OBJS = 32
+
+# do_edge_calls() only does a few comparisons per object, so the fixed cost
+# of the numpy version takes even longer to pay off there.
+EDGE_NUMPY_MIN_OBJS = 256
+
+# most nearby() methods return False after only a few partners; so, when we
+# have numpy, we don't sort all n-1 partners of an object up front.  Instead,
+# we find (and sort) only the closest few; if the user wants more, we double
+# the number and try again.  This is how many we start with, unless the
+# "nearby_k_hint" config option says otherwise.
+NEARBY_K_START = 8
+
+
+
+# _pairwise_sort_keys(xs,ys,rs, account, D) fills in the n x n matrix D,
+# which we use to sort the partners of each object (row) by distance.  The
+# caller provides D so that it can reuse the same memory on every tick.
+#
+# If 'account' is False, then these are the *squared* distances between the
+# points (xs[i],ys[i]); they sort in the same order as the real distances,
+# and the caller only needs to take the square root of the ones that it
+# actually delivers.  If 'account' is True, then we have to subtract the
+# radii of both objects before we sort - and that only works on the real
+# distance - so in that case, we return the real distance, minus the radii.
+#
+# The matrix is built one tile of TILE_ROWS rows at a time.  In the numba
+# version, each tile is a separate unit of parallel work; in the numpy
+# version, it keeps the temporary arrays at TILE_ROWS x n (instead of n x n),
+# so that they stay in the cache.
+
+TILE_ROWS = 128
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True, fastmath=True)
+    def _pairwise_sort_keys(xs, ys, rs, account, D):
+        n = xs.shape[0]
+
+        num_tiles = (n + TILE_ROWS-1) // TILE_ROWS
+
+        for t in numba.prange(num_tiles):
+            lo = t*TILE_ROWS
+            hi = min(lo+TILE_ROWS, n)
+
+            for i in range(lo,hi):
+                xi = xs[i]
+                yi = ys[i]
+
+                for j in range(n):
+                    dx = xi - xs[j]
+                    dy = yi - ys[j]
+                    D[i,j] = dx*dx + dy*dy
+
+                if account:
+                    ri = rs[i]
+                    for j in range(n):
+                        D[i,j] = np.float32(math.sqrt(D[i,j])) - (ri + rs[j])
+
+elif np is not None:
+    def _pairwise_sort_keys(xs, ys, rs, account, D):
+        n = xs.shape[0]
+
+        for lo in range(0, n, TILE_ROWS):
+            hi   = min(lo+TILE_ROWS, n)
+            tile = D[lo:hi]
+
+            dx = xs[lo:hi,None] - xs[None,:]
+            dy = ys[lo:hi,None] - ys[None,:]
+            np.multiply(dx,dx, out=tile)
+            dy *= dy
+            tile += dy
+
+            if account:
+                np.sqrt(tile, out=tile)
+                tile -= rs[lo:hi,None] + rs[None,:]
+
+
 
 class Game:
     def __init__(self, title, frame_rate, wid,hei):
@@ -31,31 +141,89 @@ class Game:
         # the distance between objects in do_nearby_calls()
         self._account_for_radii_in_dist = False
 
-        # the user must call add_obj() to add to this set
-        self._active_objs = set()
+        # another configuration setting: if not None, then do_nearby_calls()
+        # will only deliver pairs which are within this distance of each other
+        self._nearby_max_dist = None
+
+        # and another: how many partners we expect a typical nearby() user to
+        # look at, before returning False.  See NEARBY_K_START.
+        self._nearby_k_hint = None
+
+        # the user must call add_obj() to add to this list.  We loop over the
+        # list (which is faster than looping over a set); _active_idx maps
+        # each object to its index in the list, so that we can quickly check
+        # whether an object is in the game, and quickly remove it.
+        self._active_list = []
+        self._active_idx  = {}
 
         # see what remove_obj() and perform_moves() do, to understand this
         # variable.
         self._pending_removes = set()
         self._pending_adds    = set()
 
+        # "structure of arrays" caches of the position and radius of every
+        # active object; see _refresh_soa().  The data at index i of _xs,
+        # _ys, and _rs belongs to the object _active_list[i].
+        self._xs = []
+        self._ys = []
+        self._rs = []
+        self._soa_is_numpy = False
+
+        # when we have numpy, the caches above are slices of these buffers,
+        # which we only reallocate when the number of objects grows past
+        # _soa_capacity.  _keys_buf holds the matrix for
+        # _pairwise_sort_keys(); only _do_nearby_calls_numpy() uses it, so
+        # it (re)allocates it there, when n grows past _keys_capacity.
+        self._soa_capacity  = 0
+        self._keys_capacity = 0
+        self._xs_buf   = None
+        self._ys_buf   = None
+        self._rs_buf   = None
+        self._keys_buf = None
+
+        # memoryviews of the three buffers above.  _refresh_soa() fills the
+        # buffers through these, one element at a time; that is much cheaper
+        # than indexing into the numpy arrays themselves.
+        self._xs_view = None
+        self._ys_view = None
+        self._rs_view = None
+
         # I plan to add a feature, where the user can mark the game as "over"
         self._game_over = False
 
 
 
     def config_set(self, param, val):
-        """Function to set various config variables.  Right now, it only
-           supports a single parameter; I might add more later.  Give the name
-           of the parameter (as a string), then the value.
+        """Function to set various config variables.  Give the name of the
+           parameter (as a string), then the value.
 
            Parmeters: config parameter to set, value
 
            Supported Config Options:
              "account_for_radii_in_dist" -> Boolean
+             "nearby_max_dist"           -> number, or None (the default).
+                                            If set, nearby() is only called
+                                            for pairs of objects which are
+                                            no more than this far apart.
+             "nearby_k_hint"             -> positive int, or None (the
+                                            default).  A guess at how many
+                                            partners nearby() usually
+                                            accepts before returning False.
+                                            Only affects performance.
         """
         if param == "account_for_radii_in_dist":
             self._account_for_radii_in_dist = val
+        elif param == "nearby_max_dist":
+            assert val is None or val >= 0
+            self._nearby_max_dist = val
+        elif param == "nearby_k_hint":
+            if val is not None:
+                # operator.index() accepts any integer type (including numpy
+                # ones), and rejects floats; but it would also accept a bool.
+                assert not isinstance(val, bool)
+                val = operator.index(val)
+                assert val >= 1
+            self._nearby_k_hint = val
         else:
             assert False   # unrecognized config parameter
 
@@ -99,6 +267,10 @@ class Game:
     # methods.  We will do this by calling the _execute_adds_and_removes()
     # helper.
     #
+    # A nice side effect of this is that _active_list never changes while
+    # any of the phases are running - so every phase can loop over the list
+    # directly, without making a copy of it first.
+    #
     # NOTE:
     # When the user calls remove_obj(), it *MUST* be in the current set of
     # active objects.  It is *permissible* to call it multiple times in the
@@ -113,7 +285,7 @@ class Game:
 
            Parameters: the new object
         """
-        assert new_obj not in self._active_objs
+        assert new_obj not in self._active_idx
         assert new_obj not in self._pending_adds
         self._pending_adds.add(new_obj)
 
@@ -127,7 +299,7 @@ class Game:
 
            Arguments: object to remove
         """
-        assert bad_obj in self._active_objs
+        assert bad_obj in self._active_idx
         self._pending_removes.add(bad_obj)
 
 
@@ -136,11 +308,92 @@ class Game:
         """Helper function, used to handle common code in several of the
            primary game-loop functions.  Do not call directly.
         """
-        self._active_objs -= self._pending_removes
-        self._pending_removes = set()
+        # most ticks have nothing to add or remove
+        if not self._pending_removes and not self._pending_adds:
+            return
 
-        self._active_objs.update(self._pending_adds)
-        self._pending_adds = set()
+        active = self._active_list
+        index  = self._active_idx
+
+        # to remove an object, we move the last object in the list into its
+        # slot, and then shorten the list.  That keeps the list dense without
+        # having to shift everything down.
+        for o in self._pending_removes:
+            i    = index.pop(o)
+            last = active.pop()
+            if last is not o:
+                active[i]   = last
+                index[last] = i
+        self._pending_removes.clear()
+
+        for o in self._pending_adds:
+            index[o] = len(active)
+            active.append(o)
+        self._pending_adds.clear()
+
+
+
+    def _refresh_soa(self):
+        """Helper function, which copies the current position and radius of
+           every active object into the _xs, _ys, and _rs caches.  Called
+           once at the top of each phase that needs them, so that we call
+           get_xy() and get_radius() only once per object.  Do not call
+           directly.
+
+           If we have numpy, and at least NUMPY_MIN_OBJS objects, then the
+           caches are numpy arrays (and _soa_is_numpy is True); otherwise,
+           the phases will use plain Python loops, and so the caches are
+           plain lists.
+        """
+        objs = self._active_list
+        n    = len(objs)
+
+        self._soa_is_numpy = np is not None and n >= NUMPY_MIN_OBJS
+
+        if not self._soa_is_numpy:
+            xs = []
+            ys = []
+            rs = []
+            for o in objs:
+                x,y = o.get_xy()
+                xs.append(x)
+                ys.append(y)
+                rs.append(o.get_radius())
+
+        else:
+            # we store these as 32-bit floats; that's plenty of precision
+            # for positions in a window, and it halves the amount of memory
+            # that the distance calculation has to read.
+            if n > self._soa_capacity:
+                # grow by half again, so that a slowly growing game doesn't
+                # reallocate every tick.
+                cap = max(n, self._soa_capacity*3//2)
+                self._soa_capacity = cap
+                self._xs_buf = np.empty(cap, dtype=np.float32)
+                self._ys_buf = np.empty(cap, dtype=np.float32)
+                self._rs_buf = np.empty(cap, dtype=np.float32)
+
+                self._xs_view = memoryview(self._xs_buf)
+                self._ys_view = memoryview(self._ys_buf)
+                self._rs_view = memoryview(self._rs_buf)
+
+            # write straight into the buffers; no temporary lists.
+            xs_view = self._xs_view
+            ys_view = self._ys_view
+            rs_view = self._rs_view
+            for i,o in enumerate(objs):
+                x,y = o.get_xy()
+                xs_view[i] = x
+                ys_view[i] = y
+                rs_view[i] = o.get_radius()
+
+            xs = self._xs_buf[:n]
+            ys = self._ys_buf[:n]
+            rs = self._rs_buf[:n]
+
+        self._xs = xs
+        self._ys = ys
+        self._rs = rs
 
 
 
@@ -152,74 +405,301 @@ class Game:
            inner loop, and then start delivering values for another left-hand
            value.
 
+           If the "nearby_max_dist" config option has been set, then pairs
+           which are farther apart than that are never delivered.
+
            Parameters: none
         """
 
-        positions = []
-        for o in self._active_objs:
-            x,y = o.get_xy()
-            positions.append( (o,x,y) )
+        # with fewer than two objects, there are no pairs at all
+        if len(self._active_list) < 2:
+            return
+
+        self._refresh_soa()
+        objs = self._active_list
+        n    = len(objs)
+
+        if self._nearby_max_dist is not None and n >= GRID_MIN_OBJS:
+            cell_size = self._grid_cell_size()
+            num_cells = (self._wid/cell_size) * (self._hei/cell_size)
+
+            if np is None or num_cells >= GRID_MIN_CELLS:
+                self._do_nearby_calls_grid(cell_size)
+                return
+
+        if self._soa_is_numpy:
+            self._do_nearby_calls_numpy()
+            return
+
+        # _refresh_soa() gave us lists, since we're below NUMPY_MIN_OBJS
+        xs = self._xs
+        ys = self._ys
+        rs = self._rs
 
         # Note that we're doing a 2D loop, but because we're only looking for
         # one version of each pair (not the reversed), notice that we do
         # something funny with the lower bound of the inner loop variable.
-        distances = []
-        for i in range(len(positions)):
-            for j in range(i+1, len(positions)):
-                o1,x1,y1 = positions[i]
-                o2,x2,y2 = positions[j]
+        #
+        # Each object gets its own list of (dist,j) partner records; we add
+        # each pair to *both* lists, so that we can simply sort each list at
+        # the end.  (This used to be one big list of (i,dist,j) records, but
+        # sorting n short lists is cheaper than sorting one long one, and it
+        # means that we don't have to carry, or compare, the i values.)
+        partners = [ [] for _ in range(n) ]
+        for i in range(n):
+            x1,y1 = xs[i],ys[i]
 
-                dist = math.sqrt( (x1-x2)**2 + (y1-y2)**2 )
+            for j in range(i+1, n):
+                # hypot() does the squares, the sum, and the square root all
+                # in one C call.
+                dist = math.hypot(x1-xs[j], y1-ys[j])
 
                 if self._account_for_radii_in_dist:
-                    dist -= o1.get_radius()
-                    dist -= o2.get_radius()
-
-                # we add two records to the 'distances' array, so that we can
-                # simply *sort* that list at the end.  Note that the way that
-                # we arrange this, we will organize first by the left-hand
-                # object, then by the distance, and then by the right-hand
-                # object (the last of which will rarely be an issue)
-                #
-                # UPDATE: Note that I wanted to use object references here -
-                #         but then I realized that we couldn't sort by those!
-                #         so I need to use the indices into the positions[]
-                #         array instead.
-                distances.append( (i,dist,j) )
-                distances.append( (j,dist,i) )
-
-
-        # now that we're done *creating* the distances, we can sort all of
-        # them.
-        distances.sort()
-
-
-        # there should be exactly n(n-1) elements in the array - since every
-        # object in the game will be paired with n-1 others.
-        n = len(positions)
-        assert len(distances) == n*(n-1)
-
-        # this loop is weird - but we have n different objects, each of which
-        # has n-1 partners.  So I will implement each inner loop as looping
-        # over a slice of the distances array.
+                    dist -= rs[i]
+                    dist -= rs[j]
+
+                # Note that I wanted to use object references here - but then
+                # I realized that we couldn't sort by those!  So I need to use
+                # the indices into the _active_list[] array instead.
+                partners[i].append( (dist,j) )
+                partners[j].append( (dist,i) )
+
+        # now that we're done *creating* the distances, we can sort each list
+        # (by the distance, and then by the right-hand object - the last of
+        # which will rarely be an issue) and make the calls.
+        #
+        # We look up the nearby() method of each left-hand object just once,
+        # instead of once per partner.
         for i in range(n):
-            for entry in distances[ (n-1)*i : (n-1)*(i+1) ]:
-                k1,dist,k2 = entry
-                assert k1 == i
+            row = partners[i]
+            row.sort()
 
-                left  = positions[k1][0]
-                right = positions[k2][0]
+            nearby = objs[i].nearby
+
+            for dist,j in row:
+                # the partners are sorted by distance, so once we've gone
+                # past the max, all of the rest are too far away as well.
+                if self._nearby_max_dist is not None and dist > self._nearby_max_dist:
+                    break
+
+                right = objs[j]
 
                 # if the user returns False, then we will terminate this as a
                 # left-hand element.
-                if not left.nearby(right, dist, self):
+                if not nearby(right, dist, self):
+                    break
+
+
+    def _do_nearby_calls_numpy(self):
+        """Helper for do_nearby_calls(), used when numpy is available.  We
+           compute the entire distance matrix at once (compiled with numba,
+           if we have it, or using numpy broadcasting if not), rather than
+           looping over the pairs in Python.  Do not call directly.
+        """
+
+        objs = self._active_list
+        n    = len(objs)
+
+        account  = self._account_for_radii_in_dist
+        max_dist = self._nearby_max_dist
+
+        # the other phases never touch this buffer, so we only allocate it
+        # here.  Like the SoA buffers, we grow it by half again (in each
+        # dimension), so that a game which gains an object every tick
+        # doesn't reallocate the largest buffer we have every tick.
+        if n > self._keys_capacity:
+            cap = max(n, self._keys_capacity*3//2)
+            self._keys_capacity = cap
+            self._keys_buf = np.empty(cap*cap, dtype=np.float32)
+
+        # a contiguous n x n view of the front of the buffer
+        D = self._keys_buf[:n*n].reshape(n,n)
+        _pairwise_sort_keys(self._xs, self._ys, self._rs, account, D)
+
+        # D might hold squared distances (see _pairwise_sort_keys()), so
+        # square the cutoff to match.
+        if max_dist is not None and not account:
+            max_key = max_dist*max_dist
+        else:
+            max_key = max_dist
+
+        # the row includes the object itself, so we always need one more
+        # than the number of partners.
+        if self._nearby_k_hint is not None:
+            first_k = self._nearby_k_hint + 1
+        else:
+            first_k = NEARBY_K_START + 1
+
+        for i in range(n):
+            row    = D[i]
+            nearby = objs[i].nearby
+
+            # 'done' is how many entries (in sorted order) of this row we've
+            # already delivered; 'k' is how many we will sort this time around.
+            done = 0
+            k    = first_k
+
+            while True:
+                if k >= n:
+                    order = np.argsort(row, kind='stable')
+                else:
+                    # find the k-th smallest key, and then grab *everything*
+                    # which is no bigger than that.  If there are ties at the
+                    # k-th key, that might be more than k entries - but it
+                    # means that this is always the front of the complete
+                    # sorted order, so the next time around (with a bigger k)
+                    # we can just pick up where we left off.
+                    kth   = np.partition(row, k-1)[k-1]
+                    order = np.flatnonzero(row <= kth)
+
+                    # a stable sort breaks ties by the index of the right-hand
+                    # object, which matches the ordering of the Python
+                    # version.
+                    order = order[np.argsort(row[order], kind='stable')]
+
+                stop = False
+                for j in order[done:]:
+                    if j == i:
+                        continue
+
+                    # convert back to a plain Python float; nearby() shouldn't
+                    # have to know that we use numpy.
+                    key = float(row[j])
+                    if max_key is not None and key > max_key:
+                        stop = True
+                        break
+
+                    # we only take the square root of the distances that we
+                    # actually deliver.
+                    if account:
+                        dist = key
+                    else:
+                        dist = math.sqrt(key)
+
+                    right = objs[j]
+                    if not nearby(right, dist, self):
+                        stop = True
+                        break
+
+                if stop or len(order) == n:
+                    break
+
+                done = len(order)
+                k   *= 2
+
+
+
+    def _grid_cell_size(self):
+        """Helper for do_nearby_calls(), which returns the width of the cells
+           that _do_nearby_calls_grid() would use.  Do not call directly.
+        """
+
+        max_dist = self._nearby_max_dist
+
+        # if we're subtracting the radii, then two objects can be farther
+        # apart (center to center) than max_dist, and still be delivered.
+        if self._account_for_radii_in_dist:
+            cell_size = max_dist + 2*float(max(self._rs))
+        else:
+            cell_size = max_dist
+
+        # a larger cell is always safe (it just gives more candidates); this
+        # keeps us from dividing by zero.
+        return max(cell_size, 1)
+
+
+
+    def _do_nearby_calls_grid(self, cell_size):
+        """Helper for do_nearby_calls(), used when "nearby_max_dist" is set.
+           We drop every object into a grid of square cells, where each cell
+           is as wide as the largest distance we care about; that way, all of
+           the partners for any object must be in its own cell, or one of the
+           8 cells around it.  We only compute distances for those
+           candidates.  Do not call directly.
+
+           The grid is rebuilt on every call, so add_obj() and remove_obj()
+           don't have to know about it.
+
+           Parameters: the cell width, from _grid_cell_size()
+        """
+
+        max_dist = self._nearby_max_dist
+
+        objs = self._active_list
+        xs   = self._xs
+        ys   = self._ys
+        rs   = self._rs
+
+        # this loop is all plain Python, which is much faster on lists than
+        # it is on numpy arrays.
+        if self._soa_is_numpy:
+            xs = xs.tolist()
+            ys = ys.tolist()
+            rs = rs.tolist()
+
+        account = self._account_for_radii_in_dist
+
+        grid  = {}
+        cells = []
+        for i in range(len(objs)):
+            key = (math.floor(xs[i]/cell_size), math.floor(ys[i]/cell_size))
+            cells.append(key)
+            grid.setdefault(key, []).append(i)
+
+        max_dist2 = max_dist*max_dist
+
+        for i,left in enumerate(objs):
+            x1,y1 = xs[i],ys[i]
+            cx,cy = cells[i]
+
+            # we reject candidates by comparing the *squared* distances, so
+            # that we never take a square root for a pair that we won't
+            # deliver.  Without radii, the squared distance also sorts in the
+            # right order, so we keep it as the sort key; with radii, we
+            # have to finish computing the real distance before we sort.
+            candidates = []
+            for gx in (cx-1, cx, cx+1):
+                for gy in (cy-1, cy, cy+1):
+                    for j in grid.get( (gx,gy), () ):
+                        if j == i:
+                            continue
+
+                        dx = x1-xs[j]
+                        dy = y1-ys[j]
+                        dist2 = dx*dx + dy*dy
+
+                        if account:
+                            radii = rs[i] + rs[j]
+                            reach = max_dist + radii
+                            if dist2 <= reach*reach:
+                                candidates.append( (math.sqrt(dist2) - radii, j) )
+                        else:
+                            if dist2 <= max_dist2:
+                                candidates.append( (dist2,j) )
+
+            # same ordering as the other versions: by distance, then by the
+            # index of the right-hand object.
+            candidates.sort()
+
+            nearby = left.nearby
+            for key,j in candidates:
+                if account:
+                    dist = key
+                else:
+                    dist = math.sqrt(key)
+
+                right = objs[j]
+                if not nearby(right, dist, self):
                     break
 
 
 
     def do_move_calls(self):
         """Calls move() on every object in the game"""
-        for o in self._active_objs:
+
+        # no need to copy the list: adds and removes are deferred until
+        # draw(), so it can't change under us.
+        for o in self._active_list:
             o.move(self)
 
 
@@ -232,7 +712,38 @@ class Game:
            Parameters: none
         """
 
-        for o in self._active_objs:
+        objs = self._active_list
+        if not objs:
+            return
+
+        wid = self._wid
+        hei = self._hei
+
+        if np is not None and len(objs) >= EDGE_NUMPY_MIN_OBJS:
+            self._refresh_soa()
+
+            xs = self._xs
+            ys = self._ys
+            rs = self._rs
+
+            # compare every object against all four edges at once; usually,
+            # very few objects are touching any edge, and so we only make a
+            # handful of edge() calls.
+            for i in np.flatnonzero(xs < rs):
+                objs[i].edge("left", 0)
+            for i in np.flatnonzero(ys < rs):
+                objs[i].edge("top", 0)
+
+            for i in np.flatnonzero(xs+rs >= wid):
+                objs[i].edge("right", wid)
+            for i in np.flatnonzero(ys+rs >= hei):
+                objs[i].edge("bottom", hei)
+            return
+
+        # with only a few objects (or no numpy), it's cheaper to just ask each
+        # object for its position as we go; building the caches would only
+        # add work, since we look at each object just once.
+        for o in objs:
             x,y = o.get_xy()
             rad = o.get_radius()
 
@@ -241,10 +752,10 @@ class Game:
             if y < rad:
                 o.edge("top", 0)
 
-            if x+rad >= self._wid:
-                o.edge("right", self._wid)
-            if y+rad >= self._hei:
-                o.edge("bottom", self._hei)
+            if x+rad >= wid:
+                o.edge("right", wid)
+            if y+rad >= hei:
+                o.edge("bottom", hei)
 
 
 
@@ -264,7 +775,7 @@ class Game:
 
         self._win.clear()
 
-        for o in self._active_objs:
+        for o in self._active_list:
             o.draw(self._win)
 
         self._win.update_frame(self._frame_rate)